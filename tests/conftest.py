@@ -0,0 +1,93 @@
+"""Shared fixtures for the activities API tests.
+
+The src/ path insertion and the app import happen here exactly once per
+pytest-xdist worker instead of at the top of every test module.
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app import activities
+from app import app as fastapi_app
+
+
+@pytest.fixture(scope="session")
+def app():
+    return fastapi_app
+
+
+@pytest.fixture(scope="session")
+async def client(app):
+    """One in-process ASGI client shared by every test on a single event loop.
+
+    Dispatching through ASGITransport avoids the portal thread and the
+    sync-to-async bridge that TestClient pays on every request.
+    """
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as async_client:
+        yield async_client
+
+
+class ActivitiesState:
+    """Caches the parsed /activities payload until a mutation invalidates it."""
+
+    def __init__(self, client):
+        self._client = client
+        self._cache = None
+
+    async def get(self):
+        if self._cache is None:
+            response = await self._client.get("/activities")
+            self._cache = response.json()
+        return self._cache
+
+    def invalidate(self):
+        self._cache = None
+
+
+@pytest.fixture
+def state(client):
+    return ActivitiesState(client)
+
+
+@pytest.fixture(autouse=True)
+def _reset_activities():
+    """Snapshot the in-memory store and restore it after every test.
+
+    Signups would otherwise leak into the shared dict and make tests
+    order-dependent, which is unsafe under xdist scheduling.
+    """
+    snapshot = copy.deepcopy(activities)
+    yield
+    activities.clear()
+    activities.update(snapshot)
+
+
+@pytest.fixture(scope="session")
+def emails(worker_id):
+    """Worker-unique signup emails, built once per session instead of in
+    per-test f-string loops. worker_id is "master" outside xdist."""
+    return [f"{worker_id}-s{i}@mergington.edu" for i in range(64)]
+
+
+@pytest.fixture
+def fill_activity(emails):
+    """Bulk-add participants directly to the in-memory store.
+
+    Filling seats through the dict costs one list append per seat instead
+    of a full ASGI dispatch; _reset_activities restores the store afterwards.
+    """
+
+    def _fill(activity_name, count):
+        batch = emails[:count]
+        activities[activity_name]["participants"].extend(batch)
+        return batch
+
+    return _fill
@@ -0,0 +1,138 @@
+"""Tests for the Mergington High School activities API."""
+
+import asyncio
+
+import pytest
+
+# pytest-xdist workers are separate processes, so each one imports its own
+# copy of the in-memory activities dict. Emails built from the worker_id
+# fixture additionally guarantee that signups can never collide if state
+# ever becomes shared.
+
+# Activity names used across many tests, folded once at import. httpx
+# percent-encodes them per request, so no pre-quoted variants are needed.
+CHESS_CLUB = "Chess Club"
+PROGRAMMING_CLASS = "Programming Class"
+GYM_CLASS = "Gym Class"
+FAKE_ACTIVITY = "Fake Activity"
+
+
+async def signup(client, activity, email, state=None):
+    """POST a signup for ``email``; httpx encodes the name and email itself.
+
+    Passing ``state`` invalidates its cached payload after the mutation.
+    """
+    response = await client.post(
+        f"/activities/{activity}/signup", params={"email": email}
+    )
+    if state is not None:
+        state.invalidate()
+    return response
+
+
+@pytest.fixture(scope="session")
+async def baseline_activities(client):
+    """Activities payload fetched once per session for read-only assertions."""
+    response = await client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_root_route_registered(app):
+    # The redirect target is a static constant, so the router configuration
+    # can be checked in process without an ASGI dispatch.
+    route = next(r for r in app.routes if getattr(r, "path", None) == "/")
+    assert route.endpoint.__name__ == "root"
+
+
+async def test_root_redirect(client):
+    # One real request keeps the redirect itself covered end to end.
+    response = await client.get("/", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "/static/index.html"
+
+
+async def test_get_activities(baseline_activities):
+    assert CHESS_CLUB in baseline_activities
+    assert PROGRAMMING_CLASS in baseline_activities
+    assert GYM_CLASS in baseline_activities
+
+
+async def test_activity_structure(baseline_activities):
+    for details in baseline_activities.values():
+        assert "description" in details
+        assert "schedule" in details
+        assert "max_participants" in details
+        assert "participants" in details
+        assert isinstance(details["participants"], list)
+
+
+async def test_existing_participants_listed(baseline_activities):
+    assert "michael@mergington.edu" in baseline_activities[CHESS_CLUB]["participants"]
+
+
+# The parametrize values must be identical on every xdist worker, or the
+# run aborts at collection; the worker prefix is applied in the test body.
+@pytest.mark.parametrize(
+    "activity, email_local, expected_status, expected_detail",
+    [
+        (CHESS_CLUB, "test", 200, None),
+        (PROGRAMMING_CLASS, "new-student", 200, None),
+        (FAKE_ACTIVITY, "test", 404, "Activity not found"),
+    ],
+)
+async def test_signup(
+    client, worker_id, activity, email_local, expected_status, expected_detail
+):
+    email = f"{worker_id}-{email_local}@mergington.edu"
+    response = await signup(client, activity, email)
+    assert response.status_code == expected_status
+    if expected_status == 200:
+        assert email in response.json()["message"]
+        current = (await client.get("/activities")).json()
+        assert email in current[activity]["participants"]
+    else:
+        assert response.json()["detail"] == expected_detail
+
+
+async def test_signup_fills_activity_to_capacity(
+    client, worker_id, baseline_activities, fill_activity, state
+):
+    # _reset_activities restores the store between tests, so the session
+    # baseline counts are current here.
+    activity = GYM_CLASS
+    current_count = len(baseline_activities[activity]["participants"])
+    max_participants = baseline_activities[activity]["max_participants"]
+    # Bulk-fill all but the last seat in process; only the final seat
+    # exercises the real endpoint.
+    fill_activity(activity, max_participants - current_count - 1)
+    response = await signup(
+        client, activity, f"{worker_id}-laststudent@mergington.edu", state=state
+    )
+    assert response.status_code == 200
+    current = await state.get()
+    assert len(current[activity]["participants"]) == max_participants
+
+
+async def test_full_signup_cycle(client, worker_id, state):
+    email = f"{worker_id}-cycle@mergington.edu"
+    before = len((await state.get())[CHESS_CLUB]["participants"])
+    response = await signup(client, CHESS_CLUB, email, state=state)
+    assert response.status_code == 200
+    current = await state.get()
+    assert email in current[CHESS_CLUB]["participants"]
+    assert len(current[CHESS_CLUB]["participants"]) == before + 1
+
+
+async def test_multiple_participants(client, state, emails):
+    batch = emails[:5]
+    # The signups are independent, so let the event loop overlap them
+    # instead of paying one serial round-trip per participant.
+    responses = await asyncio.gather(
+        *(signup(client, PROGRAMMING_CLASS, email, state=state) for email in batch)
+    )
+    for response in responses:
+        assert response.status_code == 200
+    current = await state.get()
+    for email in batch:
+        assert email in current[PROGRAMMING_CLASS]["participants"]